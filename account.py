@@ -4,6 +4,8 @@
 class Account:
     """Store bank account state, including Phase 4 master-file metadata."""
 
+    __slots__ = ('account_number', 'holder_name', 'status', 'balance', 'total_transactions', 'plan')
+
     STUDENT_PLAN = 'SP'
     NON_STUDENT_PLAN = 'NP'
 
@@ -85,22 +87,19 @@ class Account:
 
     def to_current_file_string(self, include_plan: bool = True) -> str:
         """Format this account as one fixed-width Current Accounts file line."""
-        account_num = self.account_number.zfill(5)
-        name = self.holder_name.ljust(20)[:20]
-        balance = f"{self.balance:08.2f}"
         if include_plan:
-            return f"{account_num} {name} {self.status} {balance} {self.plan}"
-        return f"{account_num} {name} {self.status} {balance}"
+            return f"{self.account_number:0>5} {self.holder_name:<20.20} {self.status} {self.balance:08.2f} {self.plan}"
+        return f"{self.account_number:0>5} {self.holder_name:<20.20} {self.status} {self.balance:08.2f}"
 
     def to_master_file_string(self, include_plan: bool = True) -> str:
         """Format this account as one fixed-width Master Accounts file line."""
-        account_num = self.account_number.zfill(5)
-        name = self.holder_name.ljust(20)[:20]
-        balance = f"{self.balance:08.2f}"
-        transactions = str(self.total_transactions).zfill(4)
+        line = (
+            f"{self.account_number:0>5} {self.holder_name:<20.20} {self.status} "
+            f"{self.balance:08.2f} {self.total_transactions:04d}"
+        )
         if include_plan:
-            return f"{account_num} {name} {self.status} {balance} {transactions} {self.plan}"
-        return f"{account_num} {name} {self.status} {balance} {transactions}"
+            return f"{line} {self.plan}"
+        return line
 
     def to_file_string(self) -> str:
         """Format this account using the current-account file layout."""
@@ -1,9 +1,21 @@
 """Core transaction controller for the Front End console prototype."""
 
+from collections import deque
+
 from account import Account
 from file_handler import FileHandler
-from transaction import Transaction
-from validator import Validator
+from transaction import (
+    Transaction,
+    create_account,
+    create_changeplan,
+    create_delete,
+    create_deposit,
+    create_disable,
+    create_paybill,
+    create_transfer,
+    create_withdrawal,
+)
+from validator import Validator, to_cents
 
 
 class BankingSystem:
@@ -14,19 +26,43 @@ class BankingSystem:
         self.file_handler = FileHandler()
         self.validator = Validator()
         self.accounts: list[Account] = []
-        self.transactions: list[Transaction] = []
+        self.transactions: deque[Transaction] = deque()
+        self._by_number: dict[str, Account] = {}
+        self._by_name_number: dict[tuple[str, str], Account] = {}
+        self._max_number = 0
+        self._pending_creates: set[str] = set()
 
         self.is_logged_in = False
         self.is_admin = False
         self.current_user: str | None = None
 
-        self.session_withdrawals = 0.0
-        self.session_transfers = 0.0
-        self.session_paybills = 0.0
+        self.session_withdrawal_cents = 0
+        self.session_transfer_cents = 0
+        self.session_paybill_cents = 0
 
     def load_accounts(self, file_content: str) -> None:
-        """Load accounts from Current Bank Accounts file contents."""
-        self.accounts = self.file_handler.parse_accounts_file(file_content)
+        """Load accounts from Current Bank Accounts file contents and rebuild the lookup indexes."""
+        accounts = self.file_handler.parse_accounts_file(file_content)
+        by_number: dict[str, Account] = {}
+        by_name_number: dict[tuple[str, str], Account] = {}
+        max_number = 0
+        for account in accounts:
+            number = account.get_account_number()
+            # The first record wins when the file repeats a key.
+            by_number.setdefault(number, account)
+            by_name_number.setdefault((account.get_holder_name(), number), account)
+            try:
+                value = int(number)
+            except ValueError:
+                continue
+            if value > max_number:
+                max_number = value
+
+        # Swap in the new state only after the whole file parsed, so a failed reload keeps the old one.
+        self.accounts = accounts
+        self._by_number = by_number
+        self._by_name_number = by_name_number
+        self._max_number = max_number
 
     def get_accounts(self) -> list[Account]:
         """Return the currently loaded account list."""
@@ -42,17 +78,11 @@ class BankingSystem:
 
     def find_account_by_number(self, account_number: str) -> Account | None:
         """Find any account by account number."""
-        for account in self.accounts:
-            if account.get_account_number() == str(account_number):
-                return account
-        return None
+        return self._by_number.get(str(account_number))
 
     def find_user_account(self, holder_name: str, account_number: str) -> Account | None:
         """Find an account by holder name plus account number"""
-        for account in self.accounts:
-            if account.get_holder_name() == holder_name and account.get_account_number() == str(account_number):
-                return account
-        return None
+        return self._by_name_number.get((holder_name, str(account_number)))
 
     def process_login(self, mode: str, user_name: str | None = None) -> tuple[bool, str]:
         """Process login transaction and enforce login mode rules."""
@@ -83,9 +113,9 @@ class BankingSystem:
         self.is_logged_in = False
         self.is_admin = False
         self.current_user = None
-        self.session_withdrawals = 0.0
-        self.session_transfers = 0.0
-        self.session_paybills = 0.0
+        self.session_withdrawal_cents = 0
+        self.session_transfer_cents = 0
+        self.session_paybill_cents = 0
 
         return True, 'Session ended. Transaction file ready for download.'
 
@@ -96,13 +126,13 @@ class BankingSystem:
 
         owner = holder_name if self.is_admin else (self.current_user or '')
         account = self.find_user_account(owner, account_number)
-        error = self.validator.validate_withdrawal(account, amount, self.is_admin, self.session_withdrawals)
+        error = self.validator.validate_withdrawal(account, amount, self.is_admin, self.session_withdrawal_cents)
         if error:
             return False, error
 
         account.withdraw(amount)
-        self.session_withdrawals += amount
-        self.transactions.append(Transaction.create_withdrawal(owner, account_number, amount))
+        self.session_withdrawal_cents += to_cents(amount)
+        self.transactions.append(create_withdrawal(owner, account_number, amount))
         return True, f'Withdrawal of ${amount:.2f} successful. New balance: ${account.get_balance():.2f}'
 
     def process_transfer(self, source_number: str, target_number: str, amount: float, holder_name: str | None = None) -> tuple[bool, str]:
@@ -113,14 +143,14 @@ class BankingSystem:
         owner = holder_name if self.is_admin else (self.current_user or '')
         source = self.find_user_account(owner, source_number)
         target = self.find_account_by_number(target_number)
-        error = self.validator.validate_transfer(source, target, amount, self.is_admin, self.session_transfers)
+        error = self.validator.validate_transfer(source, target, amount, self.is_admin, self.session_transfer_cents)
         if error:
             return False, error
 
         source.withdraw(amount)
         target.deposit(amount)
-        self.session_transfers += amount
-        self.transactions.append(Transaction.create_transfer(owner, source_number, target_number, amount))
+        self.session_transfer_cents += to_cents(amount)
+        self.transactions.append(create_transfer(owner, source_number, target_number, amount))
         return True, f'Transfer of ${amount:.2f} successful.'
 
     def process_paybill(self, account_number: str, amount: float, company: str, holder_name: str | None = None) -> tuple[bool, str]:
@@ -130,13 +160,13 @@ class BankingSystem:
 
         owner = holder_name if self.is_admin else (self.current_user or '')
         account = self.find_user_account(owner, account_number)
-        error = self.validator.validate_paybill(account, amount, company, self.is_admin, self.session_paybills)
+        error = self.validator.validate_paybill(account, amount, company, self.is_admin, self.session_paybill_cents)
         if error:
             return False, error
 
         account.withdraw(amount)
-        self.session_paybills += amount
-        self.transactions.append(Transaction.create_paybill(owner, account_number, amount, company))
+        self.session_paybill_cents += to_cents(amount)
+        self.transactions.append(create_paybill(owner, account_number, amount, company))
         return True, f'Bill payment of ${amount:.2f} to {company} successful.'
 
     def process_deposit(self, account_number: str, amount: float, holder_name: str | None = None) -> tuple[bool, str]:
@@ -150,7 +180,7 @@ class BankingSystem:
         if error:
             return False, error
 
-        self.transactions.append(Transaction.create_deposit(owner, account_number, amount))
+        self.transactions.append(create_deposit(owner, account_number, amount))
         return True, f'Deposit of ${amount:.2f} accepted (available next session).'
 
     def process_create(self, holder_name: str, initial_balance: float) -> tuple[bool, str]:
@@ -166,7 +196,8 @@ class BankingSystem:
         if error:
             return False, error
 
-        self.transactions.append(Transaction.create_account(holder_name, new_number, initial_balance))
+        self.transactions.append(create_account(holder_name, new_number, initial_balance))
+        self._pending_creates.add(new_number)
         return True, f'Account {new_number} created for {holder_name} (available next session).'
 
     def process_delete(self, holder_name: str, account_number: str) -> tuple[bool, str]:
@@ -181,8 +212,8 @@ class BankingSystem:
         if error:
             return False, error
 
-        self.accounts = [a for a in self.accounts if not (a.get_holder_name() == holder_name and a.get_account_number() == account_number)]
-        self.transactions.append(Transaction.create_delete(holder_name, account_number))
+        self._remove_accounts(holder_name, account_number)
+        self.transactions.append(create_delete(holder_name, account_number))
         return True, f'Account {account_number} for {holder_name} deleted.'
 
     def process_disable(self, holder_name: str, account_number: str) -> tuple[bool, str]:
@@ -198,7 +229,7 @@ class BankingSystem:
             return False, error
 
         account.disable()
-        self.transactions.append(Transaction.create_disable(holder_name, account_number))
+        self.transactions.append(create_disable(holder_name, account_number))
         return True, f'Account {account_number} for {holder_name} disabled.'
 
     def process_changeplan(self, holder_name: str, account_number: str) -> tuple[bool, str]:
@@ -213,28 +244,44 @@ class BankingSystem:
         if error:
             return False, error
 
-        self.transactions.append(Transaction.create_changeplan(holder_name, account_number))
+        self.transactions.append(create_changeplan(holder_name, account_number))
         return True, f'Payment plan changed for account {account_number}.'
 
     def generate_transaction_file(self) -> str:
         """Generate full output transaction file content for the current session."""
         return self.file_handler.generate_transaction_file(self.transactions)
 
+    def clear_transactions(self) -> None:
+        """Discard staged session transactions once they have been written out."""
+        self.transactions.clear()
+        self._pending_creates.clear()
+
+    def write_transaction_file(self, file_path: str) -> None:
+        """Write the output transaction file for the current session in a single write."""
+        self.file_handler.write_transaction_file(self.transactions, file_path)
+
     def _generate_account_number(self) -> str:
-        """Generate the next sequential account number from loaded accounts."""
-        max_number = 0
+        """Generate the next sequential account number from the highest loaded account number."""
+        return str(self._max_number + 1).zfill(5)
+
+    def _remove_accounts(self, holder_name: str, account_number: str) -> None:
+        """Remove every account matching holder and number, re-pointing the number index to a survivor."""
+        del self._by_name_number[(holder_name, account_number)]
+        remaining: list[Account] = []
+        replacement: Account | None = None
         for account in self.accounts:
-            try:
-                value = int(account.get_account_number())
-            except ValueError:
-                continue
-            if value > max_number:
-                max_number = value
-        return str(max_number + 1).zfill(5)
+            if account.get_account_number() == account_number:
+                if account.get_holder_name() == holder_name:
+                    continue
+                if replacement is None:
+                    replacement = account
+            remaining.append(account)
+        self.accounts = remaining
+        if replacement is None:
+            self._by_number.pop(account_number, None)
+        else:
+            self._by_number[account_number] = replacement
 
     def _has_pending_create(self, account_number: str) -> bool:
         """Return True when the current session already staged a create for the same account number."""
-        for transaction in self.transactions:
-            if transaction.code == Transaction.CODES['CREATE'] and transaction.account_number == account_number:
-                return True
-        return False
+        return account_number in self._pending_creates
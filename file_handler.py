@@ -1,5 +1,8 @@
 """Parse and write fixed-format Front End and Back End files."""
 
+import sys
+from collections.abc import Iterable
+
 from account import Account
 from transaction import Transaction
 
@@ -44,17 +47,21 @@ class FileHandler:
     def parse_current_accounts_file(self, file_content: str) -> list[Account]:
         """Parse Current Bank Accounts file text into account objects."""
         accounts: list[Account] = []
+        eof_index = file_content.find('END_OF_FILE')
+        if eof_index != -1:
+            # Drop the sentinel line and everything after it in one slice instead of searching every line.
+            line_start = max(file_content.rfind('\n', 0, eof_index), file_content.rfind('\r', 0, eof_index)) + 1
+            file_content = file_content[:line_start]
         for line_number, line in enumerate(file_content.splitlines(), start=1):
             if not line.strip():
                 continue
-            if 'END_OF_FILE' in line:
-                break
             if len(line) < 37:
                 raise ValueError(f'Current accounts line {line_number} is too short: {len(line)}')
 
             account_number = line[0:5].strip()
-            holder_name = line[6:26].strip()
-            status = line[27:28].strip()
+            # Interned so lookup keys and console-entered names share one hashed string object.
+            holder_name = sys.intern(line[6:26].strip())
+            status = sys.intern(line[27:28].strip())
             balance_text = line[29:37].strip()
             plan = line[38:].strip() if len(line) >= 39 else Account.NON_STUDENT_PLAN
 
@@ -120,11 +127,18 @@ class FileHandler:
         return transactions
 
     @staticmethod
-    def generate_transaction_file(transactions: list[Transaction]) -> str:
+    def write_transaction_file(transactions: Iterable[Transaction], file_path: str) -> None:
+        """Write session transactions plus end-of-session marker to file as one UTF-8 byte blob."""
+        lines = [transaction.to_file_bytes() for transaction in transactions]
+        lines.append(Transaction.create_end_session().to_file_bytes())
+        lines.append(b'')
+        with open(file_path, 'wb') as file:
+            file.write(b'\n'.join(lines))
+
+    @staticmethod
+    def generate_transaction_file(transactions: Iterable[Transaction]) -> str:
         """Serialize all session transactions plus end-of-session marker."""
-        lines = [transaction.to_file_string() for transaction in transactions]
-        lines.append(Transaction.create_end_session().to_file_string())
-        return '\n'.join(lines) + '\n'
+        return Transaction.format_batch([*transactions, Transaction.create_end_session()])
 
     @staticmethod
     def generate_current_accounts_file(accounts: list[Account], include_plan: bool = True) -> str:
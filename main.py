@@ -18,12 +18,35 @@ Example:
     python main.py currentaccounts.txt transout.atf
 """
 
+import math
 import sys
+from collections.abc import Callable, Iterator
+from functools import lru_cache
 
 from banking_system import BankingSystem
 from file_handler import FileHandler
 
 
+@lru_cache(maxsize=1024)
+def parse_positive_amount(text: str) -> float | None:
+    """Parse a positive amount; return None when parsing fails or value is invalid."""
+    try:
+        amount = float(text)
+    except ValueError:
+        return None
+    return amount if amount > 0 and math.isfinite(amount) else None
+
+
+@lru_cache(maxsize=1024)
+def parse_non_negative_amount(text: str) -> float | None:
+    """Parse a non-negative amount; return None when parsing fails or value is invalid."""
+    try:
+        amount = float(text)
+    except ValueError:
+        return None
+    return amount if amount >= 0 and math.isfinite(amount) else None
+
+
 class BankingConsole:
     """Console interface for session commands and guided transaction prompts."""
 
@@ -49,19 +72,33 @@ class BankingConsole:
         """Run command input loop and guided transaction/login flows."""
         self.out('Banking System Front End (Console)')
         self.out('Enter "login" to start a session.')
-        while True:
-            try:
-                text = input('> ').strip()
-            except EOFError:
-                self.out('Exiting.')
-                return
-
+        for line in self.read_input_lines():
+            text = line.strip()
             if not text:
                 continue
             if self.current_flow:
                 self.handle_flow_input(text)
                 continue
             self.handle_command(text.lower())
+        self.out('Exiting.')
+
+    @staticmethod
+    def read_input_lines() -> Iterator[str]:
+        """Yield input lines, writing the '> ' prompt before each read."""
+        if sys.stdin.isatty():
+            while True:
+                try:
+                    yield input('> ')
+                except EOFError:
+                    return
+        else:
+            # Scripted input: input() would flush stdout and readline once per command, so iterate
+            # stdin directly and let stdout buffer the prompts. The transcript stays byte-identical.
+            write = sys.stdout.write
+            write('> ')
+            for line in sys.stdin:
+                yield line
+                write('> ')
 
     def load_accounts(self) -> bool:
         """Load the Current Bank Accounts file from the command-line path."""
@@ -77,265 +114,226 @@ class BankingConsole:
 
     def handle_command(self, command: str) -> None:
         """Handle top-level commands when no guided prompt flow is active."""
-        if command == 'login':
-            if self.system.session_status()['is_logged_in']:
-                self.err('Already logged in. Please logout first.')
-                return
-            self.current_flow = 'login_mode'
-            self.out('Enter session type (standard/admin):')
+        handler = self._COMMANDS.get(command)
+        if handler is None:
+            self.err('Invalid command. Use login, logout, withdrawal, transfer, paybill, deposit, create, delete, disable, changeplan.')
             return
+        handler(self, command)
 
-        if command == 'logout':
-            ok, msg = self.system.process_logout()
-            if not ok:
-                self.err(msg)
-                return
-            self.out(msg)
-            self.write_transaction_file()
+    def _cmd_login(self, command: str) -> None:
+        """Start the login prompt flow unless a session is already active."""
+        if self.system.is_logged_in:
+            self.err('Already logged in. Please logout first.')
             return
-
-        if command in {'withdrawal', 'withdraw', 'transfer', 'paybill', 'deposit', 'create', 'delete', 'disable', 'changeplan'}:
-            self.start_transaction_flow(command)
+        self.current_flow = 'login_mode'
+        self.out('Enter session type (standard/admin):')
+
+    def _cmd_logout(self, command: str) -> None:
+        """End the active session and write its transaction file."""
+        ok, msg = self.system.process_logout()
+        if not ok:
+            self.err(msg)
             return
-
-        self.err('Invalid command. Use login, logout, withdrawal, transfer, paybill, deposit, create, delete, disable, changeplan.')
+        self.out(msg)
+        self.write_transaction_file()
 
     def start_transaction_flow(self, command: str) -> None:
         """Start guided data-entry prompts for the selected transaction code."""
-        status = self.system.session_status()
-        if not status['is_logged_in']:
+        if not self.system.is_logged_in:
             self.err('Must be logged in to perform transactions.')
             return
-        tx = 'withdrawal' if command == 'withdraw' else command
-        self.current_flow = tx
+        admin_flow, admin_prompt, standard_flow, standard_prompt = self._FLOW_STARTS[command]
         self.flow_data = {}
-        is_admin = bool(status['is_admin'])
-        if tx == 'withdrawal':
-            self.current_flow = 'withdrawal_name' if is_admin else 'withdrawal_account'
-            self.out('Enter account holder name:' if is_admin else 'Enter account number:')
-        elif tx == 'transfer':
-            self.current_flow = 'transfer_name' if is_admin else 'transfer_source'
-            self.out('Enter account holder name:' if is_admin else 'Enter source account number:')
-        elif tx == 'paybill':
-            self.current_flow = 'paybill_name' if is_admin else 'paybill_account'
-            self.out('Enter account holder name:' if is_admin else 'Enter account number:')
-        elif tx == 'deposit':
-            self.current_flow = 'deposit_name' if is_admin else 'deposit_account'
-            self.out('Enter account holder name:' if is_admin else 'Enter account number:')
-        elif tx == 'create':
-            self.current_flow = 'create_name'
-            self.out('Enter new account holder name:')
-        elif tx == 'delete':
-            self.current_flow = 'delete_name'
-            self.out('Enter account holder name:')
-        elif tx == 'disable':
-            self.current_flow = 'disable_name'
-            self.out('Enter account holder name:')
-        elif tx == 'changeplan':
-            self.current_flow = 'changeplan_name'
-            self.out('Enter account holder name:')
+        if self.system.is_admin:
+            self.current_flow = admin_flow
+            self.out(admin_prompt)
+        else:
+            self.current_flow = standard_flow
+            self.out(standard_prompt)
 
     def handle_flow_input(self, text: str) -> None:
         """Handle one input line while in login or transaction prompt flow."""
         flow = self.current_flow
-        if flow == 'login_mode':
-            mode = text.lower()
-            if mode == 'admin':
-                if not self.load_accounts():
-                    self.current_flow = None
-                    return
-                ok, msg = self.system.process_login('admin')
-                self.out(msg) if ok else self.err(msg)
-                self.current_flow = None
-            elif mode == 'standard':
-                self.current_flow = 'login_name'
-                self.out('Enter account holder name:')
-            else:
-                self.err('Invalid mode. Use standard or admin.')
+        step = self._FLOW_STEPS.get(flow)
+        if step is not None:
+            data_key, next_flow, prompt, transform = step
+            self.flow_data[data_key] = transform(text) if transform else text
+            self.current_flow = next_flow
+            self.out(prompt)
             return
 
-        if flow == 'login_name':
+        action = self._FLOW_ACTIONS.get(flow)
+        if action is not None:
+            action(self, text)
+
+    def _login_mode(self, text: str) -> None:
+        """Handle the session-type answer of the login flow."""
+        mode = text.lower()
+        if mode == 'admin':
             if not self.load_accounts():
                 self.current_flow = None
                 return
-            ok, msg = self.system.process_login('standard', text)
+            ok, msg = self.system.process_login('admin')
             self.out(msg) if ok else self.err(msg)
             self.current_flow = None
-            return
-
-        self.handle_transaction_flow(text)
+        elif mode == 'standard':
+            self.current_flow = 'login_name'
+            self.out('Enter account holder name:')
+        else:
+            self.err('Invalid mode. Use standard or admin.')
 
-    def handle_transaction_flow(self, text: str) -> None:
-        """Handle one input line for any in-progress transaction prompt sequence."""
-        flow = self.current_flow
-        if flow == 'withdrawal_name':
-            self.flow_data['name'] = text
-            self.current_flow = 'withdrawal_account'
-            self.out('Enter account number:')
-            return
-        if flow == 'withdrawal_account':
-            self.flow_data['account'] = text
-            self.current_flow = 'withdrawal_amount'
-            self.out('Enter amount to withdraw:')
-            return
-        if flow == 'withdrawal_amount':
-            amount = self.parse_positive_amount(text)
-            if amount is None:
-                self.err('Invalid amount. Enter a positive number.')
-                self.out('Enter amount to withdraw:')
-                return
-            ok, msg = self.system.process_withdrawal(self.flow_data['account'], amount, self.flow_data.get('name'))
-            self.out(msg) if ok else self.err(msg)
+    def _login_name(self, text: str) -> None:
+        """Handle the account-holder answer of a standard login flow."""
+        if not self.load_accounts():
             self.current_flow = None
             return
-
-        if flow == 'transfer_name':
-            self.flow_data['name'] = text
-            self.current_flow = 'transfer_source'
-            self.out('Enter source account number:')
-            return
-        if flow == 'transfer_source':
-            self.flow_data['source'] = text
-            self.current_flow = 'transfer_target'
-            self.out('Enter destination account number:')
+        ok, msg = self.system.process_login('standard', sys.intern(text))
+        self.out(msg) if ok else self.err(msg)
+        self.current_flow = None
+
+    def _finish(self, result: tuple[bool, str]) -> None:
+        """Report a transaction result and close the active prompt flow."""
+        ok, msg = result
+        self.out(msg) if ok else self.err(msg)
+        self.current_flow = None
+
+    def _positive_amount_or_reprompt(self, text: str, prompt: str) -> float | None:
+        """Parse a positive amount, re-prompting the user when it is invalid."""
+        amount = parse_positive_amount(text)
+        if amount is None:
+            self.err('Invalid amount. Enter a positive number.')
+            self.out(prompt)
+        return amount
+
+    def _withdrawal_amount(self, text: str) -> None:
+        """Submit a withdrawal once a valid amount is entered."""
+        amount = self._positive_amount_or_reprompt(text, 'Enter amount to withdraw:')
+        if amount is None:
             return
-        if flow == 'transfer_target':
-            self.flow_data['target'] = text
-            self.current_flow = 'transfer_amount'
-            self.out('Enter amount to transfer:')
+        self._finish(self.system.process_withdrawal(self.flow_data['account'], amount, self.flow_data.get('name')))
+
+    def _transfer_amount(self, text: str) -> None:
+        """Submit a transfer once a valid amount is entered."""
+        amount = self._positive_amount_or_reprompt(text, 'Enter amount to transfer:')
+        if amount is None:
             return
-        if flow == 'transfer_amount':
-            amount = self.parse_positive_amount(text)
-            if amount is None:
-                self.err('Invalid amount. Enter a positive number.')
-                self.out('Enter amount to transfer:')
-                return
-            ok, msg = self.system.process_transfer(
+        self._finish(
+            self.system.process_transfer(
                 self.flow_data['source'],
                 self.flow_data['target'],
                 amount,
                 self.flow_data.get('name'),
             )
-            self.out(msg) if ok else self.err(msg)
-            self.current_flow = None
-            return
+        )
 
-        if flow == 'paybill_name':
-            self.flow_data['name'] = text
-            self.current_flow = 'paybill_account'
-            self.out('Enter account number:')
-            return
-        if flow == 'paybill_account':
-            self.flow_data['account'] = text
-            self.current_flow = 'paybill_company'
-            self.out('Enter company code (EC, CQ, FI):')
-            return
-        if flow == 'paybill_company':
-            self.flow_data['company'] = text.upper()
-            self.current_flow = 'paybill_amount'
-            self.out('Enter amount to pay:')
+    def _paybill_amount(self, text: str) -> None:
+        """Submit a bill payment once a valid amount is entered."""
+        amount = self._positive_amount_or_reprompt(text, 'Enter amount to pay:')
+        if amount is None:
             return
-        if flow == 'paybill_amount':
-            amount = self.parse_positive_amount(text)
-            if amount is None:
-                self.err('Invalid amount. Enter a positive number.')
-                self.out('Enter amount to pay:')
-                return
-            ok, msg = self.system.process_paybill(
+        self._finish(
+            self.system.process_paybill(
                 self.flow_data['account'],
                 amount,
                 self.flow_data['company'],
                 self.flow_data.get('name'),
             )
-            self.out(msg) if ok else self.err(msg)
-            self.current_flow = None
-            return
+        )
 
-        if flow == 'deposit_name':
-            self.flow_data['name'] = text
-            self.current_flow = 'deposit_account'
-            self.out('Enter account number:')
-            return
-        if flow == 'deposit_account':
-            self.flow_data['account'] = text
-            self.current_flow = 'deposit_amount'
-            self.out('Enter amount to deposit:')
-            return
-        if flow == 'deposit_amount':
-            amount = self.parse_positive_amount(text)
-            if amount is None:
-                self.err('Invalid amount. Enter a positive number.')
-                self.out('Enter amount to deposit:')
-                return
-            ok, msg = self.system.process_deposit(self.flow_data['account'], amount, self.flow_data.get('name'))
-            self.out(msg) if ok else self.err(msg)
-            self.current_flow = None
+    def _deposit_amount(self, text: str) -> None:
+        """Submit a deposit once a valid amount is entered."""
+        amount = self._positive_amount_or_reprompt(text, 'Enter amount to deposit:')
+        if amount is None:
             return
+        self._finish(self.system.process_deposit(self.flow_data['account'], amount, self.flow_data.get('name')))
 
-        if flow == 'create_name':
-            self.flow_data['name'] = text
-            self.current_flow = 'create_balance'
+    def _create_balance(self, text: str) -> None:
+        """Submit an account creation once a valid initial balance is entered."""
+        amount = parse_non_negative_amount(text)
+        if amount is None:
+            self.err('Invalid amount. Enter a non-negative number.')
             self.out('Enter initial balance:')
             return
-        if flow == 'create_balance':
-            amount = self.parse_non_negative_amount(text)
-            if amount is None:
-                self.err('Invalid amount. Enter a non-negative number.')
-                self.out('Enter initial balance:')
-                return
-            ok, msg = self.system.process_create(self.flow_data['name'], amount)
-            self.out(msg) if ok else self.err(msg)
-            self.current_flow = None
-            return
+        self._finish(self.system.process_create(self.flow_data['name'], amount))
 
-        if flow in {'delete_name', 'disable_name', 'changeplan_name'}:
-            self.flow_data['name'] = text
-            self.current_flow = flow.replace('_name', '_account')
-            self.out('Enter account number:')
-            return
+    def _delete_account(self, text: str) -> None:
+        """Submit an account deletion for the entered account number."""
+        self._finish(self.system.process_delete(self.flow_data['name'], text))
 
-        if flow == 'delete_account':
-            ok, msg = self.system.process_delete(self.flow_data['name'], text)
-            self.out(msg) if ok else self.err(msg)
-            self.current_flow = None
-            return
-
-        if flow == 'disable_account':
-            ok, msg = self.system.process_disable(self.flow_data['name'], text)
-            self.out(msg) if ok else self.err(msg)
-            self.current_flow = None
-            return
-
-        if flow == 'changeplan_account':
-            ok, msg = self.system.process_changeplan(self.flow_data['name'], text)
-            self.out(msg) if ok else self.err(msg)
-            self.current_flow = None
-
-    @staticmethod
-    def parse_positive_amount(text: str) -> float | None:
-        """Parse a positive amount; return None when parsing fails or value is invalid."""
-        try:
-            amount = float(text)
-        except ValueError:
-            return None
-        return amount if amount > 0 else None
+    def _disable_account(self, text: str) -> None:
+        """Submit an account disable for the entered account number."""
+        self._finish(self.system.process_disable(self.flow_data['name'], text))
 
-    @staticmethod
-    def parse_non_negative_amount(text: str) -> float | None:
-        """Parse a non-negative amount; return None when parsing fails or value is invalid."""
-        try:
-            amount = float(text)
-        except ValueError:
-            return None
-        return amount if amount >= 0 else None
+    def _changeplan_account(self, text: str) -> None:
+        """Submit a payment-plan change for the entered account number."""
+        self._finish(self.system.process_changeplan(self.flow_data['name'], text))
 
     def write_transaction_file(self) -> None:
         """Write the daily Bank Account Transaction file to disk using the CLI-provided output path."""
-        content = self.system.generate_transaction_file()
-        FileHandler.write_file(content, self.output_file)
-        self.system.transactions.clear()
+        self.system.write_transaction_file(self.output_file)
+        self.system.clear_transactions()
         self.out(f'Transaction file written: {self.output_file}')
 
+    # Top-level command -> handler(self, command).
+    _COMMANDS: dict[str, Callable[['BankingConsole', str], None]] = {
+        'login': _cmd_login,
+        'logout': _cmd_logout,
+        'withdrawal': start_transaction_flow,
+        'withdraw': start_transaction_flow,
+        'transfer': start_transaction_flow,
+        'paybill': start_transaction_flow,
+        'deposit': start_transaction_flow,
+        'create': start_transaction_flow,
+        'delete': start_transaction_flow,
+        'disable': start_transaction_flow,
+        'changeplan': start_transaction_flow,
+    }
+
+    # Transaction command -> (admin flow, admin prompt, standard flow, standard prompt).
+    _FLOW_STARTS: dict[str, tuple[str, str, str, str]] = {
+        'withdrawal': ('withdrawal_name', 'Enter account holder name:', 'withdrawal_account', 'Enter account number:'),
+        'withdraw': ('withdrawal_name', 'Enter account holder name:', 'withdrawal_account', 'Enter account number:'),
+        'transfer': ('transfer_name', 'Enter account holder name:', 'transfer_source', 'Enter source account number:'),
+        'paybill': ('paybill_name', 'Enter account holder name:', 'paybill_account', 'Enter account number:'),
+        'deposit': ('deposit_name', 'Enter account holder name:', 'deposit_account', 'Enter account number:'),
+        'create': ('create_name', 'Enter new account holder name:', 'create_name', 'Enter new account holder name:'),
+        'delete': ('delete_name', 'Enter account holder name:', 'delete_name', 'Enter account holder name:'),
+        'disable': ('disable_name', 'Enter account holder name:', 'disable_name', 'Enter account holder name:'),
+        'changeplan': ('changeplan_name', 'Enter account holder name:', 'changeplan_name', 'Enter account holder name:'),
+    }
+
+    # Data-entry flow -> (flow_data key, next flow, next prompt, optional input transform).
+    _FLOW_STEPS: dict[str, tuple[str, str, str, Callable[[str], str] | None]] = {
+        'withdrawal_name': ('name', 'withdrawal_account', 'Enter account number:', sys.intern),
+        'withdrawal_account': ('account', 'withdrawal_amount', 'Enter amount to withdraw:', None),
+        'transfer_name': ('name', 'transfer_source', 'Enter source account number:', sys.intern),
+        'transfer_source': ('source', 'transfer_target', 'Enter destination account number:', None),
+        'transfer_target': ('target', 'transfer_amount', 'Enter amount to transfer:', None),
+        'paybill_name': ('name', 'paybill_account', 'Enter account number:', sys.intern),
+        'paybill_account': ('account', 'paybill_company', 'Enter company code (EC, CQ, FI):', None),
+        'paybill_company': ('company', 'paybill_amount', 'Enter amount to pay:', str.upper),
+        'deposit_name': ('name', 'deposit_account', 'Enter account number:', sys.intern),
+        'deposit_account': ('account', 'deposit_amount', 'Enter amount to deposit:', None),
+        'create_name': ('name', 'create_balance', 'Enter initial balance:', None),
+        'delete_name': ('name', 'delete_account', 'Enter account number:', sys.intern),
+        'disable_name': ('name', 'disable_account', 'Enter account number:', sys.intern),
+        'changeplan_name': ('name', 'changeplan_account', 'Enter account number:', sys.intern),
+    }
+
+    # Flows whose input is parsed or submitted by a handler(self, text).
+    _FLOW_ACTIONS: dict[str, Callable[['BankingConsole', str], None]] = {
+        'login_mode': _login_mode,
+        'login_name': _login_name,
+        'withdrawal_amount': _withdrawal_amount,
+        'transfer_amount': _transfer_amount,
+        'paybill_amount': _paybill_amount,
+        'deposit_amount': _deposit_amount,
+        'create_balance': _create_balance,
+        'delete_account': _delete_account,
+        'disable_account': _disable_account,
+        'changeplan_account': _changeplan_account,
+    }
+
 
 def main() -> None:
     """Program entry point — expects two command-line arguments."""
@@ -0,0 +1,127 @@
+"""Front End tests for BankingSystem account indexes and session processing."""
+
+import unittest
+
+from banking_system import BankingSystem
+from main import parse_non_negative_amount, parse_positive_amount
+from validator import Validator
+
+
+def make_admin_system(content: str) -> BankingSystem:
+    system = BankingSystem()
+    system.load_accounts(content)
+    system.process_login('admin')
+    return system
+
+
+def make_standard_system(content: str, user_name: str) -> BankingSystem:
+    system = BankingSystem()
+    system.load_accounts(content)
+    system.process_login('standard', user_name)
+    return system
+
+
+class AccountIndexTests(unittest.TestCase):
+    """Verify account lookups, deletes, and account-number generation use consistent indexes."""
+
+    CONTENT = (
+        "00001 John Doe             A 01000.00\n"
+        "00003 Jane Smith           A 00500.00\n"
+        "00003 Bob Brown            A 00200.00\n"
+        "00000 END_OF_FILE          A 00000.00\n"
+    )
+
+    def test_find_accounts_by_number_and_by_holder(self) -> None:
+        system = make_admin_system(self.CONTENT)
+
+        self.assertEqual('John Doe', system.find_account_by_number('00001').get_holder_name())
+        self.assertEqual('Jane Smith', system.find_account_by_number('00003').get_holder_name())
+        self.assertEqual('Bob Brown', system.find_user_account('Bob Brown', '00003').get_holder_name())
+        self.assertIsNone(system.find_user_account('John Doe', '00003'))
+        self.assertIsNone(system.find_account_by_number('00002'))
+
+    def test_failed_reload_keeps_previous_accounts_and_indexes(self) -> None:
+        system = make_admin_system(self.CONTENT)
+
+        with self.assertRaises(ValueError):
+            system.load_accounts("00002 Jane Smith           A 00100.00\n00004 Short\n")
+
+        self.assertEqual(3, len(system.get_accounts()))
+        self.assertEqual('John Doe', system.find_user_account('John Doe', '00001').get_holder_name())
+        self.assertIsNone(system.find_user_account('Jane Smith', '00002'))
+        self.assertIsNone(system.find_account_by_number('00002'))
+
+    def test_delete_keeps_other_holder_with_same_number_reachable(self) -> None:
+        system = make_admin_system(self.CONTENT)
+
+        ok, _ = system.process_delete('Jane Smith', '00003')
+
+        self.assertTrue(ok)
+        self.assertIsNone(system.find_user_account('Jane Smith', '00003'))
+        self.assertEqual('Bob Brown', system.find_account_by_number('00003').get_holder_name())
+        self.assertEqual(['John Doe', 'Bob Brown'], [a.get_holder_name() for a in system.get_accounts()])
+
+    def test_delete_removes_every_duplicate_record(self) -> None:
+        system = make_admin_system(
+            "00001 John Doe             A 01000.00\n"
+            "00001 John Doe             A 00010.00\n"
+        )
+
+        ok, _ = system.process_delete('John Doe', '00001')
+
+        self.assertTrue(ok)
+        self.assertEqual([], system.get_accounts())
+        self.assertIsNone(system.find_account_by_number('00001'))
+
+    def test_deleting_highest_account_does_not_reuse_its_number(self) -> None:
+        system = make_admin_system(self.CONTENT)
+
+        system.process_delete('Jane Smith', '00003')
+        system.process_delete('Bob Brown', '00003')
+        ok, message = system.process_create('New Holder', 10.0)
+
+        self.assertTrue(ok)
+        self.assertIn('Account 00004 created', message)
+
+
+class SessionLimitTests(unittest.TestCase):
+    """Verify per-session limits are enforced in exact cents without sub-cent bypasses."""
+
+    CONTENT = "00001 John Doe             A 05000.00\n"
+
+    def test_withdrawals_summing_exactly_to_limit_are_accepted(self) -> None:
+        system = make_standard_system(self.CONTENT, 'John Doe')
+
+        for amount in (91.36, 74.81, 79.73, 36.35, 53.20, 164.55):
+            ok, message = system.process_withdrawal('00001', amount)
+            self.assertTrue(ok, message)
+
+        ok, message = system.process_withdrawal('00001', 0.01)
+        self.assertFalse(ok)
+        self.assertIn('Maximum withdrawal per session', message)
+
+    def test_sub_cent_withdrawals_cannot_bypass_limit(self) -> None:
+        system = make_standard_system(self.CONTENT, 'John Doe')
+
+        for amount in (250.004, 0.005):
+            ok, message = system.process_withdrawal('00001', amount)
+            self.assertFalse(ok)
+            self.assertIn('fractions of a cent', message)
+
+        self.assertEqual(5000.0, system.find_account_by_number('00001').get_balance())
+        self.assertEqual(0, system.session_withdrawal_cents)
+
+    def test_create_rejects_sub_cent_balance_below_rounded_limit(self) -> None:
+        self.assertIsNotNone(Validator.validate_create('New Holder', 99999.994, False))
+        self.assertIsNone(Validator.validate_create('New Holder', 99999.99, False))
+
+    def test_amount_parsers_leave_sub_cent_checks_to_validators(self) -> None:
+        for text in ('inf', 'nan', '-1', 'abc'):
+            self.assertIsNone(parse_positive_amount(text))
+            self.assertIsNone(parse_non_negative_amount(text))
+        self.assertEqual(12.345, parse_positive_amount('12.345'))
+        self.assertEqual(0.0, parse_non_negative_amount('0'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -44,6 +44,21 @@ class FileHandlerPhase4Tests(unittest.TestCase):
         self.assertEqual(Account.STUDENT_PLAN, accounts[0].get_plan())
         self.assertEqual(Account.NON_STUDENT_PLAN, accounts[1].get_plan())
 
+    def test_write_transaction_file_matches_generated_text(self) -> None:
+        transactions = [
+            Transaction.create_withdrawal('John Doe', '00001', 20.0),
+            Transaction.create_transfer('John Doe', '00001', '2', 5.5),
+            Transaction.create_deposit('Zoë Ångström', '00003', 7.25),
+        ]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = Path(temp_dir) / 'session.atf'
+            FileHandler.write_transaction_file(transactions, str(output_file))
+            written = output_file.read_bytes()
+
+        self.assertEqual(FileHandler.generate_transaction_file(transactions).encode('utf-8'), written)
+        self.assertEqual(43, len(written.split(b'\n')[1]))
+
 
 class TransactionFormatTests(unittest.TestCase):
     """Verify the updated transfer record preserves the full destination account."""
@@ -58,6 +73,28 @@ class TransactionFormatTests(unittest.TestCase):
         self.assertEqual('00001', parsed.account_number)
         self.assertEqual('00002', parsed.target_account)
 
+    def test_format_batch_matches_per_record_lines(self) -> None:
+        transactions = [
+            Transaction.create_withdrawal('John Doe', '00001', 20.0),
+            Transaction.create_transfer('John Doe', '00001', '00002', 5.5),
+            Transaction.create_end_session(),
+        ]
+
+        content = Transaction.format_batch(transactions)
+
+        self.assertEqual(''.join(t.to_file_string() + '\n' for t in transactions), content)
+        self.assertEqual('', Transaction.format_batch([]))
+
+    def test_to_file_bytes_matches_encoded_text_line(self) -> None:
+        transactions = [
+            Transaction.create_paybill('John Doe', '00001', 12.5, 'EC'),
+            Transaction.create_transfer('A holder name longer than twenty', '00001', '2', 5.0),
+            Transaction.create_deposit('Zoë Ångström', '00003', 7.25),
+        ]
+
+        for transaction in transactions:
+            self.assertEqual(transaction.to_file_string().encode('utf-8'), transaction.to_file_bytes())
+
 
 class BatchProcessorTests(unittest.TestCase):
     """Verify account updates, fees, and constraint logging in the Back End."""
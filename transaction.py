@@ -1,19 +1,30 @@
 """Transaction model and parser helpers for Front End and Back End files."""
 
+import sys
+from collections.abc import Iterable
+
+# Shared blank misc field used by every transaction type without a company or destination.
+_BLANK_MISC = sys.intern('  ')
+
 
 class Transaction:
     """Represent one transaction record from a session or merged batch file."""
 
+    __slots__ = ('code', 'account_holder_name', 'account_number', 'amount', 'misc', 'target_account')
+
     CODES = {
-        'WITHDRAWAL': '01',
-        'TRANSFER': '02',
-        'PAYBILL': '03',
-        'DEPOSIT': '04',
-        'CREATE': '05',
-        'DELETE': '06',
-        'DISABLE': '07',
-        'CHANGEPLAN': '08',
-        'END_SESSION': '00',
+        name: sys.intern(code)
+        for name, code in {
+            'WITHDRAWAL': '01',
+            'TRANSFER': '02',
+            'PAYBILL': '03',
+            'DEPOSIT': '04',
+            'CREATE': '05',
+            'DELETE': '06',
+            'DISABLE': '07',
+            'CHANGEPLAN': '08',
+            'END_SESSION': '00',
+        }.items()
     }
 
     def __init__(
@@ -22,27 +33,53 @@ class Transaction:
         account_holder_name: str,
         account_number: str,
         amount: float = 0.0,
-        misc: str = '  ',
+        misc: str = _BLANK_MISC,
         target_account: str | None = None,
     ) -> None:
         """Initialize a transaction with its shared fixed-width file fields."""
         self.code = code
         self.account_holder_name = account_holder_name
-        self.account_number = str(account_number).zfill(5)
-        self.amount = float(amount)
+        # Factories already pass str numbers and float amounts; skip the coercion calls for them.
+        self.account_number = (account_number if type(account_number) is str else str(account_number)).zfill(5)
+        self.amount = amount if type(amount) is float else float(amount)
         self.misc = misc
         self.target_account = str(target_account).zfill(5) if target_account else None
 
     def to_file_string(self) -> str:
         """Format one fixed-width transaction line for the output file."""
-        name = self.account_holder_name.ljust(20)[:20]
-        account_num = self.account_number.zfill(5)
-        amount = f"{self.amount:08.2f}"
         if self.code == self.CODES['TRANSFER']:
-            target = (self.target_account or '').zfill(5)
-            return f"{self.code} {name} {account_num} {amount}{target}"
-        misc = self.misc.ljust(2)[:2]
-        return f"{self.code} {name} {account_num} {amount}{misc}"
+            return (
+                f"{self.code} {self.account_holder_name:<20.20} {self.account_number:0>5} "
+                f"{self.amount:08.2f}{self.target_account or '':0>5}"
+            )
+        return f"{self.code} {self.account_holder_name:<20.20} {self.account_number:0>5} {self.amount:08.2f}{self.misc:<2.2}"
+
+    def to_file_bytes(self) -> bytes:
+        """Return the fixed-width output line as UTF-8 bytes without the trailing newline.
+
+        ASCII records are formatted straight into bytes; any other record falls back to encoding
+        the text line so multi-byte names keep their character-based truncation.
+        """
+        try:
+            code = self.code.encode('ascii')
+            name = self.account_holder_name.encode('ascii')
+            account_num = self.account_number.encode('ascii')
+            if self.code == self.CODES['TRANSFER']:
+                target = (self.target_account or '').encode('ascii')
+                return b'%s %-20.20s %5s %08.2f%s' % (code, name, account_num, self.amount, target.rjust(5, b'0'))
+            misc = self.misc.encode('ascii')
+        except UnicodeEncodeError:
+            return self.to_file_string().encode('utf-8')
+        return b'%s %-20.20s %5s %08.2f%-2.2s' % (code, name, account_num, self.amount, misc)
+
+    @staticmethod
+    def format_batch(transactions: Iterable['Transaction']) -> str:
+        """Format many transactions as newline-terminated lines in a single string."""
+        lines = [transaction.to_file_string() for transaction in transactions]
+        if not lines:
+            return ''
+        lines.append('')
+        return '\n'.join(lines)
 
     @classmethod
     def from_file_string(cls, line: str) -> 'Transaction':
@@ -51,7 +88,7 @@ class Transaction:
         if len(clean_line) < 40:
             raise ValueError(f'Invalid transaction length ({len(clean_line)}). Expected at least 40.')
 
-        code = clean_line[0:2]
+        code = sys.intern(clean_line[0:2])
         name = clean_line[3:23].rstrip()
         account_number = clean_line[24:29]
         amount_text = clean_line[30:38]
@@ -71,52 +108,97 @@ class Transaction:
 
     @classmethod
     def create_withdrawal(cls, account_holder_name: str, account_number: str, amount: float) -> 'Transaction':
-        """Create a withdrawal transaction record."""
-        return cls(cls.CODES['WITHDRAWAL'], account_holder_name, account_number, amount, '  ')
+        """Create a withdrawal transaction record (alias of the module-level factory)."""
+        return create_withdrawal(account_holder_name, account_number, amount)
 
     @classmethod
     def create_transfer(cls, account_holder_name: str, from_account: str, to_account: str, amount: float) -> 'Transaction':
-        """Create a transfer transaction record with the full destination account number."""
-        return cls(
-            cls.CODES['TRANSFER'],
-            account_holder_name,
-            from_account,
-            amount,
-            misc=str(to_account).zfill(5),
-            target_account=to_account,
-        )
+        """Create a transfer transaction record (alias of the module-level factory)."""
+        return create_transfer(account_holder_name, from_account, to_account, amount)
 
     @classmethod
     def create_paybill(cls, account_holder_name: str, account_number: str, amount: float, company: str) -> 'Transaction':
-        """Create a paybill transaction record."""
-        return cls(cls.CODES['PAYBILL'], account_holder_name, account_number, amount, company)
+        """Create a paybill transaction record (alias of the module-level factory)."""
+        return create_paybill(account_holder_name, account_number, amount, company)
 
     @classmethod
     def create_deposit(cls, account_holder_name: str, account_number: str, amount: float) -> 'Transaction':
-        """Create a deposit transaction record."""
-        return cls(cls.CODES['DEPOSIT'], account_holder_name, account_number, amount, '  ')
+        """Create a deposit transaction record (alias of the module-level factory)."""
+        return create_deposit(account_holder_name, account_number, amount)
 
     @classmethod
     def create_account(cls, account_holder_name: str, account_number: str, initial_balance: float) -> 'Transaction':
-        """Create an account-creation transaction record."""
-        return cls(cls.CODES['CREATE'], account_holder_name, account_number, initial_balance, '  ')
+        """Create an account-creation transaction record (alias of the module-level factory)."""
+        return create_account(account_holder_name, account_number, initial_balance)
 
     @classmethod
     def create_delete(cls, account_holder_name: str, account_number: str) -> 'Transaction':
-        """Create an account-deletion transaction record."""
-        return cls(cls.CODES['DELETE'], account_holder_name, account_number, 0, '  ')
+        """Create an account-deletion transaction record (alias of the module-level factory)."""
+        return create_delete(account_holder_name, account_number)
 
     @classmethod
     def create_disable(cls, account_holder_name: str, account_number: str) -> 'Transaction':
-        """Create an account-disable transaction record."""
-        return cls(cls.CODES['DISABLE'], account_holder_name, account_number, 0, '  ')
+        """Create an account-disable transaction record (alias of the module-level factory)."""
+        return create_disable(account_holder_name, account_number)
 
     @classmethod
     def create_changeplan(cls, account_holder_name: str, account_number: str) -> 'Transaction':
-        """Create a changeplan transaction record."""
-        return cls(cls.CODES['CHANGEPLAN'], account_holder_name, account_number, 0, '  ')
+        """Create a changeplan transaction record (alias of the module-level factory)."""
+        return create_changeplan(account_holder_name, account_number)
 
     @classmethod
     def create_end_session(cls) -> 'Transaction':
         """Create the final end-of-session transaction record."""
-        return cls(cls.CODES['END_SESSION'], ' ' * 20, '00000', 0, '  ')
+        return cls(cls.CODES['END_SESSION'], ' ' * 20, '00000', 0, _BLANK_MISC)
+
+
+# Codes resolved once so the factories below skip the CODES lookup on every call.
+_WITHDRAWAL_CODE = Transaction.CODES['WITHDRAWAL']
+_TRANSFER_CODE = Transaction.CODES['TRANSFER']
+_PAYBILL_CODE = Transaction.CODES['PAYBILL']
+_DEPOSIT_CODE = Transaction.CODES['DEPOSIT']
+_CREATE_CODE = Transaction.CODES['CREATE']
+_DELETE_CODE = Transaction.CODES['DELETE']
+_DISABLE_CODE = Transaction.CODES['DISABLE']
+_CHANGEPLAN_CODE = Transaction.CODES['CHANGEPLAN']
+
+
+def create_withdrawal(account_holder_name: str, account_number: str, amount: float) -> Transaction:
+    """Create a withdrawal transaction record."""
+    return Transaction(_WITHDRAWAL_CODE, account_holder_name, account_number, amount, _BLANK_MISC)
+
+
+def create_transfer(account_holder_name: str, from_account: str, to_account: str, amount: float) -> Transaction:
+    """Create a transfer transaction record with the full destination account number."""
+    target = (to_account if type(to_account) is str else str(to_account)).zfill(5)
+    return Transaction(_TRANSFER_CODE, account_holder_name, from_account, amount, misc=target, target_account=target)
+
+
+def create_paybill(account_holder_name: str, account_number: str, amount: float, company: str) -> Transaction:
+    """Create a paybill transaction record."""
+    return Transaction(_PAYBILL_CODE, account_holder_name, account_number, amount, company)
+
+
+def create_deposit(account_holder_name: str, account_number: str, amount: float) -> Transaction:
+    """Create a deposit transaction record."""
+    return Transaction(_DEPOSIT_CODE, account_holder_name, account_number, amount, _BLANK_MISC)
+
+
+def create_account(account_holder_name: str, account_number: str, initial_balance: float) -> Transaction:
+    """Create an account-creation transaction record."""
+    return Transaction(_CREATE_CODE, account_holder_name, account_number, initial_balance, _BLANK_MISC)
+
+
+def create_delete(account_holder_name: str, account_number: str) -> Transaction:
+    """Create an account-deletion transaction record."""
+    return Transaction(_DELETE_CODE, account_holder_name, account_number, 0, _BLANK_MISC)
+
+
+def create_disable(account_holder_name: str, account_number: str) -> Transaction:
+    """Create an account-disable transaction record."""
+    return Transaction(_DISABLE_CODE, account_holder_name, account_number, 0, _BLANK_MISC)
+
+
+def create_changeplan(account_holder_name: str, account_number: str) -> Transaction:
+    """Create a changeplan transaction record."""
+    return Transaction(_CHANGEPLAN_CODE, account_holder_name, account_number, 0, _BLANK_MISC)
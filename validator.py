@@ -1,60 +1,101 @@
 """Validation rules for Front End transactions."""
 
+import math
+
 from account import Account
 
 
+def to_cents(amount: float) -> int:
+    """Convert a dollar amount to whole cents, rounding to the nearest cent."""
+    return round(amount * 100)
+
+
+def is_whole_cents(amount: float) -> bool:
+    """Return True when the amount is finite and has no digits beyond the cent."""
+    return math.isfinite(amount) and round(amount, 2) == amount
+
+
 class Validator:
-    """Applies business constraints to each transaction type."""
+    """Applies business constraints to each transaction type.
+
+    Checks run cheapest first: the amount sign needs no account access, so it is tested
+    before any account lookup result or balance.
+    """
+
+    __slots__ = ()
 
     MAX_WITHDRAWAL_STANDARD = 500.00
     MAX_TRANSFER_STANDARD = 1000.00
     MAX_PAYBILL_STANDARD = 2000.00
     MAX_ACCOUNT_BALANCE = 99999.99
     MAX_NAME_LENGTH = 20
-    VALID_COMPANIES = {'EC', 'CQ', 'FI'}
+    VALID_COMPANIES = frozenset({'EC', 'CQ', 'FI'})
+
+    # Limit checks compare whole cents so running session totals cannot drift past a limit.
+    # Amounts with fractions of a cent are rejected, so to_cents(amount) is exactly what is debited.
+    MAX_WITHDRAWAL_STANDARD_CENTS = to_cents(MAX_WITHDRAWAL_STANDARD)
+    MAX_TRANSFER_STANDARD_CENTS = to_cents(MAX_TRANSFER_STANDARD)
+    MAX_PAYBILL_STANDARD_CENTS = to_cents(MAX_PAYBILL_STANDARD)
+    MAX_ACCOUNT_BALANCE_CENTS = to_cents(MAX_ACCOUNT_BALANCE)
 
-    def validate_withdrawal(self, account: Account | None, amount: float, is_admin: bool, session_total: float) -> str | None:
+    _ERR_MAX_WITHDRAWAL = f'Maximum withdrawal per session is ${MAX_WITHDRAWAL_STANDARD:.2f}.'
+    _ERR_MAX_TRANSFER = f'Maximum transfer per session is ${MAX_TRANSFER_STANDARD:.2f}.'
+    _ERR_MAX_PAYBILL = f'Maximum paybill per session is ${MAX_PAYBILL_STANDARD:.2f}.'
+    _ERR_MAX_BALANCE = f'Maximum account balance is ${MAX_ACCOUNT_BALANCE:.2f}.'
+    _ERR_SUB_CENT = 'Amount must not include fractions of a cent.'
+    _ERR_MAX_NAMELEN = f'Account holder name must be at most {MAX_NAME_LENGTH} characters.'
+
+    @staticmethod
+    def validate_withdrawal(account: Account | None, amount: float, is_admin: bool, session_total_cents: int) -> str | None:
         """Validate withdrawal constraints and return an error message when invalid."""
+        if amount <= 0:
+            return 'Amount must be positive.'
+        if not is_whole_cents(amount):
+            return Validator._ERR_SUB_CENT
         if account is None:
             return 'Account not found.'
         if account.is_disabled():
             return 'Account is disabled.'
-        if amount <= 0:
-            return 'Amount must be positive.'
-        if (not is_admin) and (session_total + amount > self.MAX_WITHDRAWAL_STANDARD):
-            return f'Maximum withdrawal per session is ${self.MAX_WITHDRAWAL_STANDARD:.2f}.'
+        if not is_admin and session_total_cents + to_cents(amount) > Validator.MAX_WITHDRAWAL_STANDARD_CENTS:
+            return Validator._ERR_MAX_WITHDRAWAL
         if account.get_balance() < amount:
             return 'Insufficient funds.'
         return None
 
-    def validate_transfer(self, source: Account | None, target: Account | None, amount: float, is_admin: bool, session_total: float) -> str | None:
+    @staticmethod
+    def validate_transfer(source: Account | None, target: Account | None, amount: float, is_admin: bool, session_total_cents: int) -> str | None:
         """Validate transfer constraints and return an error message when invalid."""
+        if amount <= 0:
+            return 'Amount must be positive.'
+        if not is_whole_cents(amount):
+            return Validator._ERR_SUB_CENT
         if source is None:
             return 'Source account not found.'
         if target is None:
             return 'Destination account not found.'
         if source.is_disabled() or target.is_disabled():
             return 'Source or destination account is disabled.'
-        if amount <= 0:
-            return 'Amount must be positive.'
-        if (not is_admin) and (session_total + amount > self.MAX_TRANSFER_STANDARD):
-            return f'Maximum transfer per session is ${self.MAX_TRANSFER_STANDARD:.2f}.'
+        if not is_admin and session_total_cents + to_cents(amount) > Validator.MAX_TRANSFER_STANDARD_CENTS:
+            return Validator._ERR_MAX_TRANSFER
         if source.get_balance() < amount:
             return 'Insufficient funds in source account.'
         return None
 
-    def validate_paybill(self, account: Account | None, amount: float, company: str, is_admin: bool, session_total: float) -> str | None:
+    @staticmethod
+    def validate_paybill(account: Account | None, amount: float, company: str, is_admin: bool, session_total_cents: int) -> str | None:
         """Validate paybill constraints and return an error message when invalid."""
+        if amount <= 0:
+            return 'Amount must be positive.'
+        if not is_whole_cents(amount):
+            return Validator._ERR_SUB_CENT
         if account is None:
             return 'Account not found.'
         if account.is_disabled():
             return 'Account is disabled.'
-        if company not in self.VALID_COMPANIES:
+        if company not in Validator.VALID_COMPANIES:
             return 'Invalid company code. Valid codes: EC, CQ, FI.'
-        if amount <= 0:
-            return 'Amount must be positive.'
-        if (not is_admin) and (session_total + amount > self.MAX_PAYBILL_STANDARD):
-            return f'Maximum paybill per session is ${self.MAX_PAYBILL_STANDARD:.2f}.'
+        if not is_admin and session_total_cents + to_cents(amount) > Validator.MAX_PAYBILL_STANDARD_CENTS:
+            return Validator._ERR_MAX_PAYBILL
         if account.get_balance() < amount:
             return 'Insufficient funds.'
         return None
@@ -62,22 +103,27 @@ class Validator:
     @staticmethod
     def validate_deposit(account: Account | None, amount: float) -> str | None:
         """Validate deposit constraints and return an error message when invalid."""
+        if amount <= 0:
+            return 'Amount must be positive.'
+        if not is_whole_cents(amount):
+            return Validator._ERR_SUB_CENT
         if account is None:
             return 'Account not found.'
         if account.is_disabled():
             return 'Account is disabled.'
-        if amount <= 0:
-            return 'Amount must be positive.'
         return None
 
-    def validate_create(self, holder_name: str, initial_balance: float, account_exists: bool) -> str | None:
+    @staticmethod
+    def validate_create(holder_name: str, initial_balance: float, account_exists: bool) -> str | None:
         """Validate account-creation constraints and return an error message when invalid."""
-        if len(holder_name) > self.MAX_NAME_LENGTH:
-            return f'Account holder name must be at most {self.MAX_NAME_LENGTH} characters.'
+        if len(holder_name) > Validator.MAX_NAME_LENGTH:
+            return Validator._ERR_MAX_NAMELEN
         if initial_balance < 0:
             return 'Initial balance cannot be negative.'
-        if initial_balance > self.MAX_ACCOUNT_BALANCE:
-            return f'Maximum account balance is ${self.MAX_ACCOUNT_BALANCE:.2f}.'
+        if not is_whole_cents(initial_balance):
+            return Validator._ERR_SUB_CENT
+        if to_cents(initial_balance) > Validator.MAX_ACCOUNT_BALANCE_CENTS:
+            return Validator._ERR_MAX_BALANCE
         if account_exists:
             return 'Account number already exists.'
         return None
@@ -96,4 +142,4 @@ class Validator:
             return 'Account not found.'
         if account.is_disabled():
             return 'Account is already disabled.'
-        return None
+        return None